@@ -47,8 +47,6 @@ class User(Base):
     last_login = Column(DateTime, nullable=True)
     __table_args__ = (
         Index("ix_users_username_active", "username", "is_active"),
-        Index("ix_users_referral_code", "referral_code"),
-        Index("ix_users_is_creator", "is_creator"),
     )
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
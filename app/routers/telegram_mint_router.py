@@ -4,13 +4,16 @@ import anyio
 import time
 from typing import Optional
 from urllib.parse import parse_qs
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Request, BackgroundTasks
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, func
+from sqlalchemy.orm import selectinload
+from app.config import get_settings
 from app.database import get_db_session
-from app.models import User, NFT
-from app.models.marketplace import Listing
+from app.models import User, NFT, Wallet
+from app.models.marketplace import Listing, ListingStatus
 from app.models.wallet import BlockchainType
 from app.schemas.wallet import CreateWalletRequest, ImportWalletRequest, WalletResponse
 from app.schemas.nft import WebAppMintNFTRequest, WebAppListNFTRequest, WebAppTransferNFTRequest, WebAppBurnNFTRequest, WebAppSetPrimaryWalletRequest, WebAppMakeOfferRequest, WebAppCancelListingRequest
@@ -53,6 +56,90 @@ from app.utils.telegram_keyboards import (
 logger = logging.getLogger(__name__)
 router = APIRouter( tags=["telegram"])
 bot_service = TelegramBotService()
+BUTTON_COMMANDS = {
+    "🚀 Get Started": "/dashboard",
+    "📊 Dashboard": "/dashboard",
+    "📋 Menu": "/menu",
+    "💰 Balance": "/balance",
+    "⚡ Quick Mint": "/quick-mint",
+    "📤 Send": "/transfer",
+    "📤 Send NFT": "/transfer",
+    "📥 Receive": "/receive",
+    "🖼️ My NFTs": "/mynfts",
+    "📜 View My NFTs": "/mynfts",
+    "📜 My NFTs": "/mynfts",
+    "📝 My NFTs": "/mynfts",
+    "📊 My Listings": "/mylistings",
+    "📈 My Listings": "/mylistings",
+    "� Listings": "/mylistings",
+    "🛍️ Marketplace": "/browse",
+    "❓ Help": "/help",
+    "🔄 Refresh": "/balance",
+    "💰 Deposit USDT": "/deposit",
+    "⚙️ Admin": "/admin-login",
+    "🚪 Logout": "/admin-logout",
+    "💰 Commission": "/admin-commission",
+    "👥 Users": "/admin-users",
+    "📊 Statistics": "/admin-stats",
+    "💾 Backup": "/admin-backup",
+    "📈 View Rate": "/admin-view-rate",
+    "✏️ Edit Rate": "/admin-edit-rate",
+    "🏪 View Wallets": "/admin-view-wallets",
+    "🔄 Update Wallet": "/admin-update-wallet",
+    "➕ Make Admin": "/admin-make-admin",
+    "➖ Remove Admin": "/admin-remove-admin",
+    "🚫 Suspend User": "/admin-suspend",
+    "✅ Activate User": "/admin-activate",
+    "📈 System Stats": "/admin-system-stats",
+    "📋 Audit Logs": "/admin-audit-logs",
+    "👨‍💼 Admin List": "/admin-list-admins",
+    "💚 Health Check": "/admin-health-check",
+    "📥 Export Backup": "/admin-export-backup",
+    "🔧 Maintenance": "/admin-maintenance",
+    "TON": "admin-blockchain:ton",
+    "TRC20": "admin-blockchain:trc20",
+    "ERC20": "admin-blockchain:erc20",
+    "Solana": "admin-blockchain:solana",
+    "👝 Wallets": "/wallets",
+    "👝 My Wallets": "/wallets",
+    "MY WALLETS": "/wallets",
+    "➕ Create New": "/wallet-create",
+    "➕ Create Wallet": "/wallet-create",
+    "📥 Import": "/wallet-import",
+    "📥 Import Wallet": "/wallet-import",
+    "📋 List All": "/wallets",
+    "📋 List Wallets": "/wallets",
+    "⭐ Set Primary": "/set-primary",
+    "🎨 Mint NFT": "/mint",
+    "🎨 Start Minting": "/mint",
+    "📤 Transfer": "/transfer",
+    "🔥 Burn": "/burn",
+    "🛍️ List for Sale": "/list",
+    "🔍 Browse": "/browse",
+    "❤️ Favorites": "/browse",
+    "💬 Make Offer": "/offer",
+    "📊 My Listings": "/mylistings",
+    "❌ Cancel Listing": "/cancel-listing",
+    "⟡ Ethereum": "blockchain:ethereum",
+    "Ethereum": "blockchain:ethereum",
+    "🔶 Polygon": "blockchain:polygon",
+    "Polygon": "blockchain:polygon",
+    "◎ Solana": "blockchain:solana",
+    "Solana": "blockchain:solana",
+    "💎 TON": "blockchain:ton",
+    "₿ Bitcoin": "blockchain:bitcoin",
+    "Bitcoin": "blockchain:bitcoin",
+    "✅ Confirm": "confirm:yes",
+    "✅ Yes": "confirm:yes",
+    "❌ Cancel": "/start",
+    "❌ No": "/start",
+    "◀️ Back to Dashboard": "/dashboard",
+    "◀️ Back": "/dashboard",
+    "◀️ Back to Menu": "/start",
+    "◀️ Back to Admin": "/admin-dashboard",
+    "◀️ Cancel": "/start",
+    "❓ How to Mint": "/mint-help",
+}
 async def get_telegram_user_from_request(request: Request, db: AsyncSession = Depends(get_db_session)) -> dict:
     init_data_str = request.query_params.get("init_data")
     logger.debug(f"get_telegram_user_from_request: initial init_data from query: {bool(init_data_str)}")
@@ -149,6 +236,7 @@ async def get_telegram_user_from_request(request: Request, db: AsyncSession = De
     logger.debug(f"Authenticated Telegram user: {telegram_id}")
     return request.state.telegram_user
 class TelegramUser(BaseModel):
+    model_config = ConfigDict(frozen=True)
     id: int
     is_bot: bool
     first_name: str
@@ -156,18 +244,21 @@ class TelegramUser(BaseModel):
     username: Optional[str] = None
     language_code: Optional[str] = None
 class TelegramMessage(BaseModel):
+    model_config = ConfigDict(frozen=True)
     message_id: int
     date: int
     chat: dict
     from_user: TelegramUser = Field(..., alias="from")
     text: Optional[str] = None
 class TelegramCallbackQuery(BaseModel):
+    model_config = ConfigDict(frozen=True)
     id: str
     from_user: TelegramUser = Field(..., alias="from")
     chat_instance: str
     data: Optional[str] = None
     message: Optional[TelegramMessage] = None
 class TelegramUpdate(BaseModel):
+    model_config = ConfigDict(frozen=True)
     update_id: int
     message: Optional[TelegramMessage] = None
     callback_query: Optional[TelegramCallbackQuery] = None
@@ -178,7 +269,6 @@ class MintRequestData(BaseModel):
     image_url: Optional[str] = Field(None, max_length=500)
 @router.get("/webhook")
 async def telegram_webhook_get(request: Request) -> dict:
-    from app.config import get_settings
     settings = get_settings()
     if settings.environment.lower() == "production":
         logger.debug("GET request to webhook in production - returning 405")
@@ -202,7 +292,6 @@ async def telegram_webhook(
 ) -> dict:
     client_ip = request.client.host if request.client else "unknown"
     try:
-        from app.config import get_settings
         settings = get_settings()
         update_type = "message" if update.message else "callback_query" if update.callback_query else "unknown"
         logger.info(
@@ -270,92 +359,7 @@ async def handle_message(db: AsyncSession, message: TelegramMessage) -> None:
             logger.info(f"Processing password input from {username}")
             await handle_admin_password_input(db, chat_id, user, text)
             return
-    button_mapping = {
-        "🚀 Get Started": "/dashboard",
-        "📊 Dashboard": "/dashboard",
-        "📋 Menu": "/menu",
-        "💰 Balance": "/balance",
-        "⚡ Quick Mint": "/quick-mint",
-        "📤 Send": "/transfer",
-        "📤 Send NFT": "/transfer",
-        "📥 Receive": "/receive",
-        "🖼️ My NFTs": "/mynfts",
-        "📜 View My NFTs": "/mynfts",
-        "📜 My NFTs": "/mynfts",
-        "📝 My NFTs": "/mynfts",
-        "📊 My Listings": "/mylistings",
-        "📈 My Listings": "/mylistings",
-        "� Listings": "/mylistings",
-        "🛍️ Marketplace": "/browse",
-        "❓ Help": "/help",
-        "🔄 Refresh": "/balance",
-        "💰 Deposit USDT": "/deposit",
-        "⚙️ Admin": "/admin-login",
-        "🚪 Logout": "/admin-logout",
-        "💰 Commission": "/admin-commission",
-        "👥 Users": "/admin-users",
-        "📊 Statistics": "/admin-stats",
-        "💾 Backup": "/admin-backup",
-        "📈 View Rate": "/admin-view-rate",
-        "✏️ Edit Rate": "/admin-edit-rate",
-        "🏪 View Wallets": "/admin-view-wallets",
-        "🔄 Update Wallet": "/admin-update-wallet",
-        "➕ Make Admin": "/admin-make-admin",
-        "➖ Remove Admin": "/admin-remove-admin",
-        "🚫 Suspend User": "/admin-suspend",
-        "✅ Activate User": "/admin-activate",
-        "📈 System Stats": "/admin-system-stats",
-        "📋 Audit Logs": "/admin-audit-logs",
-        "👨‍💼 Admin List": "/admin-list-admins",
-        "💚 Health Check": "/admin-health-check",
-        "📥 Export Backup": "/admin-export-backup",
-        "🔧 Maintenance": "/admin-maintenance",
-        "TON": "admin-blockchain:ton",
-        "TRC20": "admin-blockchain:trc20",
-        "ERC20": "admin-blockchain:erc20",
-        "Solana": "admin-blockchain:solana",
-        "👝 Wallets": "/wallets",
-        "👝 My Wallets": "/wallets",
-        "MY WALLETS": "/wallets",
-        "➕ Create New": "/wallet-create",
-        "➕ Create Wallet": "/wallet-create",
-        "📥 Import": "/wallet-import",
-        "📥 Import Wallet": "/wallet-import",
-        "📋 List All": "/wallets",
-        "📋 List Wallets": "/wallets",
-        "⭐ Set Primary": "/set-primary",
-        "🎨 Mint NFT": "/mint",
-        "🎨 Start Minting": "/mint",
-        "📤 Transfer": "/transfer",
-        "🔥 Burn": "/burn",
-        "🛍️ List for Sale": "/list",
-        "🔍 Browse": "/browse",
-        "❤️ Favorites": "/browse",
-        "💬 Make Offer": "/offer",
-        "📊 My Listings": "/mylistings",
-        "❌ Cancel Listing": "/cancel-listing",
-        "⟡ Ethereum": "blockchain:ethereum",
-        "Ethereum": "blockchain:ethereum",
-        "🔶 Polygon": "blockchain:polygon",
-        "Polygon": "blockchain:polygon",
-        "◎ Solana": "blockchain:solana",
-        "Solana": "blockchain:solana",
-        "💎 TON": "blockchain:ton",
-        "₿ Bitcoin": "blockchain:bitcoin",
-        "Bitcoin": "blockchain:bitcoin",
-        "✅ Confirm": "confirm:yes",
-        "✅ Yes": "confirm:yes",
-        "❌ Cancel": "/start",
-        "❌ No": "/start",
-        "◀️ Back to Dashboard": "/dashboard",
-        "◀️ Back": "/dashboard",
-        "◀️ Back to Menu": "/start",
-        "◀️ Back to Admin": "/admin-dashboard",
-        "◀️ Cancel": "/start",
-        "❓ How to Mint": "/mint-help",
-    }
-    if text in button_mapping:
-        text = button_mapping[text]
+    text = BUTTON_COMMANDS.get(text, text)
     if text.startswith("blockchain:"):
         blockchain = text.split(":", 1)[1]
         logger.info(f"Detected blockchain selection from reply keyboard: {blockchain}")
@@ -495,7 +499,6 @@ async def handle_message(db: AsyncSession, message: TelegramMessage) -> None:
             "Unknown command. Use /help to see available commands.",
         )
 async def send_welcome_start(chat_id: int, username: str) -> None:
-    from app.config import get_settings
     logger.warning(f"[TELEGRAM] send_welcome_start called for chat_id={chat_id}, username={username}")
     settings = get_settings()
     message = (
@@ -554,8 +557,6 @@ async def send_dashboard(db: AsyncSession, chat_id: int, user: User, username: s
 async def send_balance(db: AsyncSession, chat_id: int, user: User) -> None:
     logger.warning(f"[TELEGRAM] Sending balance for user {user.id}")
     try:
-        from app.models import Wallet
-        from sqlalchemy import select
         wallets_result = await db.execute(
             select(Wallet).where(Wallet.user_id == user.id)
         )
@@ -678,8 +679,6 @@ async def handle_admin_commission(db: AsyncSession, chat_id: int, user: User) ->
 async def handle_admin_users(db: AsyncSession, chat_id: int, user: User) -> None:
     logger.warning(f"[ADMIN] User management menu for user {user.id}")
     from app.services.telegram_admin_service import TelegramAdminSession
-    from app.models import User as UserModel
-    from sqlalchemy import select
     if not TelegramAdminSession.is_admin_logged_in(chat_id):
         await bot_service.send_message(
             chat_id,
@@ -687,7 +686,7 @@ async def handle_admin_users(db: AsyncSession, chat_id: int, user: User) -> None
             reply_markup=build_dashboard_cta_keyboard()
         )
         return
-    result = await db.execute(select(UserModel))
+    result = await db.execute(select(User))
     users = result.scalars().all()
     message = (
         "<b>👥 User Management</b>\n\n"
@@ -702,8 +701,6 @@ async def handle_admin_users(db: AsyncSession, chat_id: int, user: User) -> None
 async def handle_admin_stats(db: AsyncSession, chat_id: int, user: User) -> None:
     logger.warning(f"[ADMIN] Statistics menu for user {user.id}")
     from app.services.telegram_admin_service import TelegramAdminSession
-    from app.models import User as UserModel, NFT, Wallet
-    from sqlalchemy import select, func
     if not TelegramAdminSession.is_admin_logged_in(chat_id):
         await bot_service.send_message(
             chat_id,
@@ -711,7 +708,7 @@ async def handle_admin_stats(db: AsyncSession, chat_id: int, user: User) -> None
             reply_markup=build_dashboard_cta_keyboard()
         )
         return
-    user_count = await db.scalar(select(func.count(UserModel.id)))
+    user_count = await db.scalar(select(func.count(User.id)))
     nft_count = await db.scalar(select(func.count(NFT.id)))
     wallet_count = await db.scalar(select(func.count(Wallet.id)))
     message = (
@@ -1043,8 +1040,6 @@ async def handle_callback_query(db: AsyncSession, callback: TelegramCallbackQuer
         )
     elif data.startswith("wallet_info_"):
         wallet_id = data.replace("wallet_info_", "")
-        from app.models import Wallet
-        from uuid import UUID
         result = await db.execute(
             select(Wallet).where(Wallet.id == UUID(wallet_id))
         )
@@ -1068,7 +1063,6 @@ async def handle_callback_query(db: AsyncSession, callback: TelegramCallbackQuer
         blockchain = data.split(":", 1)[1]
         await handle_wallet_create_command(db, chat_id, user, blockchain)
     elif data == "admin_dashboard":
-        from sqlalchemy import select
         result = await db.execute(select(User).where(User.telegram_id == str(callback.from_user.id)))
         user = result.scalar_one_or_none()
         if not user:
@@ -1154,7 +1148,6 @@ async def get_or_create_telegram_user(
     return new_user
 @router.post("/webhook/set")
 async def set_webhook(webhook_url: str) -> dict:
-    from app.config import get_settings
     settings = get_settings()
     secret = settings.telegram_webhook_secret if getattr(settings, "telegram_webhook_secret", None) else None
     success = await bot_service.set_webhook(webhook_url, secret_token=secret)
@@ -1182,7 +1175,6 @@ async def delete_webhook() -> dict:
 @router.get("/webhook/info")
 async def webhook_info() -> dict:
     try:
-        from app.config import get_settings
         settings = get_settings()
         info = await bot_service.get_webhook_info()
         return {
@@ -1205,7 +1197,6 @@ async def send_telegram_notification(
     message: str,
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    from uuid import UUID
     result = await db.execute(select(User).where(User.id == UUID(user_id)))
     user = result.scalar_one_or_none()
     if not user:
@@ -1323,7 +1314,6 @@ async def web_app_get_user(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    from uuid import UUID
     if not telegram_user.get("authenticated"):
         logger.warning(f"Unauthenticated user attempted to access /webapp/user")
         raise HTTPException(
@@ -1356,8 +1346,6 @@ async def web_app_get_wallets(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    from uuid import UUID
-    from app.models import Wallet
     if str(telegram_user["user_id"]) != user_id:
         logger.warning(f"User ID mismatch in wallets: session={telegram_user['user_id']}, requested={user_id}")
         raise HTTPException(
@@ -1391,7 +1379,6 @@ async def web_app_get_user_nfts(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    from uuid import UUID
     if not telegram_user.get("authenticated"):
         logger.warning(f"Unauthenticated user attempted to access /webapp/nfts")
         raise HTTPException(
@@ -1435,10 +1422,6 @@ async def web_app_get_dashboard_data(
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
     try:
-        from uuid import UUID
-        from app.models import Wallet
-        from app.models.marketplace import ListingStatus
-        from sqlalchemy.orm import selectinload
         if str(telegram_user["user_id"]) != user_id:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1542,9 +1525,6 @@ async def web_app_mint_nft(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
-    from app.models import Wallet
     try:
         try:
             body = getattr(http_request.state, 'body', None)
@@ -1632,8 +1612,6 @@ async def web_app_list_nft(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
     try:
         try:
             body_data = await http_request.json()
@@ -1667,7 +1645,6 @@ async def web_app_list_nft(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No primary wallet for {nft.blockchain}",
             )
-        from app.models.marketplace import Listing
         listing, error = await MarketplaceService.create_listing(
             db=db,
             nft_id=request.nft_id,
@@ -1707,8 +1684,6 @@ async def web_app_transfer_nft(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
     try:
         try:
             body = getattr(http_request.state, 'body', None)
@@ -1769,8 +1744,6 @@ async def web_app_burn_nft(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
     try:
         try:
             body = getattr(http_request.state, 'body', None)
@@ -1825,8 +1798,6 @@ async def web_app_set_primary_wallet(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
     try:
         try:
             body = getattr(http_request.state, 'body', None)
@@ -1881,8 +1852,6 @@ async def web_app_make_offer(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
     try:
         try:
             body = getattr(http_request.state, 'body', None)
@@ -1956,8 +1925,6 @@ async def web_app_cancel_listing(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    import anyio
-    from uuid import UUID
     try:
         try:
             body = getattr(http_request.state, 'body', None)
@@ -2012,8 +1979,6 @@ async def get_marketplace_listings(
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
     try:
-        from app.models.marketplace import ListingStatus
-        from sqlalchemy.orm import selectinload
         result = await db.execute(
             select(Listing)
             .options(
@@ -2066,7 +2031,6 @@ async def get_my_listings(
     telegram_user: dict = Depends(get_telegram_user_from_request),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
-    from uuid import UUID
     if str(telegram_user["user_id"]) != user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -2102,7 +2066,6 @@ async def create_wallet_for_webapp(
     auth: dict = Depends(get_telegram_user_from_request),
     background_tasks: BackgroundTasks = BackgroundTasks(),
 ) -> dict:
-    import anyio
     from app.services.activity_service import ActivityService
     from app.models.activity import ActivityType
     try:
@@ -2282,7 +2245,6 @@ async def import_wallet_for_webapp(
     db: AsyncSession = Depends(get_db_session),
     auth: dict = Depends(get_telegram_user_from_request),
 ) -> dict:
-    import anyio
     from app.services.activity_service import ActivityService
     from app.models.activity import ActivityType
     try:
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import json
 import uuid
+from collections import defaultdict
 from typing import Set, Dict, Any, Optional, TYPE_CHECKING
 from uuid import UUID
 from datetime import datetime
@@ -47,13 +49,11 @@ class Notification:
     def to_json(self) -> str:
         return json.dumps(self.to_dict())
 class NotificationService:
-    active_connections: Dict[UUID, Set[Any]] = {}
+    active_connections: Dict[UUID, Set[Any]] = defaultdict(set)
     @classmethod
     async def connect(cls, user_id: UUID, websocket: Any) -> None:
-        if user_id not in cls.active_connections:
-            cls.active_connections[user_id] = set()
         cls.active_connections[user_id].add(websocket)
-        logger.info(f"User {user_id} connected. Active: {len(cls.active_connections[user_id])}")
+        logger.info("User %s connected. Active: %d", user_id, len(cls.active_connections[user_id]))
     @classmethod
     async def disconnect(cls, user_id: UUID, websocket: Any) -> None:
         if user_id in cls.active_connections:
@@ -61,7 +61,9 @@ class NotificationService:
             if not cls.active_connections[user_id]:
                 del cls.active_connections[user_id]
             logger.info(
-                f"User {user_id} disconnected. Active: {len(cls.active_connections.get(user_id, set()))}"
+                "User %s disconnected. Active: %d",
+                user_id,
+                len(cls.active_connections.get(user_id, ())),
             )
     @classmethod
     async def send_notification(
@@ -69,19 +71,26 @@ class NotificationService:
         user_id: UUID,
         notification: Notification,
     ) -> None:
-        if user_id not in cls.active_connections:
-            logger.debug(f"User {user_id} has no active connections")
+        # .get() so a miss doesn't plant an empty set in the defaultdict.
+        connections = cls.active_connections.get(user_id)
+        if not connections:
+            logger.debug("User %s has no active connections", user_id)
             return
-        disconnected = []
-        for websocket in cls.active_connections[user_id]:
-            try:
-                await websocket.send_json(notification.to_dict())
-                logger.debug(f"Notification sent to {user_id}")
-            except Exception as e:
-                logger.error(f"Error sending notification to {user_id}: {e}")
-                disconnected.append(websocket)
-        for websocket in disconnected:
-            cls.active_connections[user_id].discard(websocket)
+        websockets = list(connections)
+        payload = notification.to_json()
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for websocket in websockets),
+            return_exceptions=True,
+        )
+        for websocket, result in zip(websockets, results):
+            if isinstance(result, BaseException):
+                logger.error("Error sending notification to %s: %s", user_id, result)
+                connections.discard(websocket)
+            else:
+                logger.debug("Notification sent to %s", user_id)
+        # Skip if a reconnect replaced the set while the sends were in flight.
+        if not connections and cls.active_connections.get(user_id) is connections:
+            del cls.active_connections[user_id]
     @classmethod
     async def broadcast_to_all(cls, notification: Notification) -> None:
         for user_id in list(cls.active_connections.keys()):
@@ -178,14 +187,14 @@ class NotificationService:
         data: Optional[Dict[str, Any]] = None,
     ) -> bool:
         if not user or not user.telegram_id:
-            logger.debug(f"User {user.id if user else 'Unknown'} has no Telegram ID")
+            logger.debug("User %s has no Telegram ID", user.id if user else "Unknown")
             return False
         try:
             from app.services.telegram_bot_service import TelegramBotService
             bot = TelegramBotService()
             return await bot.send_notification(user, title, message, data)
         except Exception as e:
-            logger.error(f"Error sending Telegram notification: {e}")
+            logger.error("Error sending Telegram notification: %s", e)
             return False
     @classmethod
     async def notify_nft_minted_telegram(
@@ -4,6 +4,10 @@ from typing import Optional, Dict, Tuple
 from enum import Enum
 from app.models.wallet import BlockchainType
 logger = logging.getLogger(__name__)
+_BASE58 = r"[1-9A-HJ-NP-Za-km-z]"
+_BTC_ADDRESS_RE = re.compile(rf"^(?:[13]{_BASE58}{{24,33}}|bc1p?[a-z0-9]{{39,87}})$")
+_SOLANA_ADDRESS_RE = re.compile(rf"{_BASE58}{{32,44}}")
+_TON_ADDRESS_RE = re.compile(r"^(?:[0-9a-fA-F]:[0-9a-fA-F]{64}|[A-Za-z0-9_\-+/]{48}[=]{0,2})$")
 class UnitType(str, Enum):
     WEI = "wei"
     GWEI = "gwei"
@@ -19,7 +23,7 @@ class AddressValidator:
     def validate_ethereum_address(address: str) -> Tuple[bool, Optional[str]]:
         if not address:
             return False, "empty address"
-        addr = re.sub(r"^0x", "", address, flags=re.IGNORECASE).strip()
+        addr = (address[2:] if address[:2].lower() == "0x" else address).strip()
         if len(addr) not in (39, 40):
             return False, "invalid eth address length"
         try:
@@ -31,13 +35,7 @@ class AddressValidator:
     def validate_bitcoin_address(address: str) -> Tuple[bool, Optional[str]]:
         if not address:
             return False, "empty address"
-        if re.match(r"^1[1-9A-HJ-NP-Za-km-z]{24,33}$", address):
-            return True, None
-        if re.match(r"^3[1-9A-HJ-NP-Za-km-z]{24,33}$", address):
-            return True, None
-        if re.match(r"^bc1[a-z0-9]{39,87}$", address):
-            return True, None
-        if re.match(r"^bc1p[a-z0-9]{39,87}$", address):
+        if _BTC_ADDRESS_RE.match(address):
             return True, None
         return False, "invalid bitcoin address"
     @staticmethod
@@ -46,16 +44,14 @@ class AddressValidator:
             return False, "empty address"
         if not (32 <= len(address) <= 44):
             return False, "invalid address length"
-        if not re.fullmatch(r"[1-9A-HJ-NP-Za-km-z]{32,44}", address):
+        if not _SOLANA_ADDRESS_RE.fullmatch(address):
             return False, "invalid address"
         return True, None
     @staticmethod
     def validate_ton_address(address: str) -> Tuple[bool, Optional[str]]:
         if not address:
             return False, "empty address"
-        if re.match(r"^[0-9a-fA-F]:[0-9a-fA-F]{64}$", address):
-            return True, None
-        if re.match(r"^[A-Za-z0-9_\-+/]{48}[=]{0,2}$", address):
+        if _TON_ADDRESS_RE.match(address):
             return True, None
         return False, "invalid ton address"
     @staticmethod
@@ -77,12 +73,16 @@ class UnitConverter:
     BITCOIN_DECIMALS = 8
     SOLANA_DECIMALS = 9
     TON_DECIMALS = 9
+    WEI_PER_ETH = 10 ** ETHEREUM_DECIMALS
+    SATOSHI_PER_BTC = 10 ** BITCOIN_DECIMALS
+    LAMPORT_PER_SOL = 10 ** SOLANA_DECIMALS
+    NANOTON_PER_TON = 10 ** TON_DECIMALS
     @staticmethod
     def wei_to_eth(wei: int) -> float:
-        return wei / (10 ** UnitConverter.ETHEREUM_DECIMALS)
+        return wei / UnitConverter.WEI_PER_ETH
     @staticmethod
     def eth_to_wei(eth: float) -> int:
-        return int(eth * (10 ** UnitConverter.ETHEREUM_DECIMALS))
+        return int(eth * UnitConverter.WEI_PER_ETH)
     @staticmethod
     def gwei_to_eth(gwei: float) -> float:
         return gwei / 1e9
@@ -97,22 +97,22 @@ class UnitConverter:
         return wei / 1e9
     @staticmethod
     def satoshi_to_btc(satoshi: int) -> float:
-        return satoshi / (10 ** UnitConverter.BITCOIN_DECIMALS)
+        return satoshi / UnitConverter.SATOSHI_PER_BTC
     @staticmethod
     def btc_to_satoshi(btc: float) -> int:
-        return int(round(btc * (10 ** UnitConverter.BITCOIN_DECIMALS)))
+        return int(round(btc * UnitConverter.SATOSHI_PER_BTC))
     @staticmethod
     def lamport_to_sol(lamports: int) -> float:
-        return lamports / (10 ** UnitConverter.SOLANA_DECIMALS)
+        return lamports / UnitConverter.LAMPORT_PER_SOL
     @staticmethod
     def sol_to_lamport(sol: float) -> int:
-        return int(sol * (10 ** UnitConverter.SOLANA_DECIMALS))
+        return int(sol * UnitConverter.LAMPORT_PER_SOL)
     @staticmethod
     def nanoton_to_ton(nanoton: int) -> float:
-        return nanoton / (10 ** UnitConverter.TON_DECIMALS)
+        return nanoton / UnitConverter.NANOTON_PER_TON
     @staticmethod
     def ton_to_nanoton(ton: float) -> int:
-        return int(ton * (10 ** UnitConverter.TON_DECIMALS))
+        return int(ton * UnitConverter.NANOTON_PER_TON)
     @staticmethod
     def convert_units(blockchain: BlockchainType, amount: float, from_unit: str, to_unit: str) -> Optional[float]:
         try:
@@ -234,56 +234,60 @@ class GasEstimator:
         except Exception as e:
             logger.error(f"Fee estimation error: {e}")
             return None
+_CHAIN_DECIMALS = {
+    BlockchainType.ETHEREUM: 18,
+    BlockchainType.POLYGON: 18,
+    BlockchainType.ARBITRUM: 18,
+    BlockchainType.OPTIMISM: 18,
+    BlockchainType.BASE: 18,
+    BlockchainType.AVALANCHE: 18,
+    BlockchainType.BITCOIN: 8,
+    BlockchainType.SOLANA: 9,
+    BlockchainType.TON: 9,
+}
+_CHAIN_SYMBOLS = {
+    BlockchainType.ETHEREUM: "ETH",
+    BlockchainType.POLYGON: "MATIC",
+    BlockchainType.ARBITRUM: "ARB",
+    BlockchainType.OPTIMISM: "OP",
+    BlockchainType.BASE: "ETH",
+    BlockchainType.AVALANCHE: "AVAX",
+    BlockchainType.BITCOIN: "BTC",
+    BlockchainType.SOLANA: "SOL",
+    BlockchainType.TON: "TON",
+}
+_LAYER1_CHAINS = frozenset((
+    BlockchainType.ETHEREUM, BlockchainType.BITCOIN,
+    BlockchainType.SOLANA, BlockchainType.TON, BlockchainType.AVALANCHE,
+))
+# (divisor, template) per chain so format_balance does one lookup.
+_BALANCE_FORMATS = {
+    chain: (10 ** decimals, "{:.6f} " + _CHAIN_SYMBOLS[chain])
+    for chain, decimals in _CHAIN_DECIMALS.items()
+}
+_DEFAULT_BALANCE_FORMAT = (10 ** 18, "{:.6f} UNKNOWN")
 class BlockchainHelper:
     @staticmethod
     def get_blockchain_decimals(blockchain: BlockchainType) -> int:
-        decimals_map = {
-            BlockchainType.ETHEREUM: 18,
-            BlockchainType.POLYGON: 18,
-            BlockchainType.ARBITRUM: 18,
-            BlockchainType.OPTIMISM: 18,
-            BlockchainType.BASE: 18,
-            BlockchainType.AVALANCHE: 18,
-            BlockchainType.BITCOIN: 8,
-            BlockchainType.SOLANA: 9,
-            BlockchainType.TON: 9,
-        }
-        return decimals_map.get(blockchain, 18)
+        return _CHAIN_DECIMALS.get(blockchain, 18)
     @staticmethod
     def get_blockchain_symbol(blockchain: BlockchainType) -> str:
-        symbols_map = {
-            BlockchainType.ETHEREUM: "ETH",
-            BlockchainType.POLYGON: "MATIC",
-            BlockchainType.ARBITRUM: "ARB",
-            BlockchainType.OPTIMISM: "OP",
-            BlockchainType.BASE: "ETH",
-            BlockchainType.AVALANCHE: "AVAX",
-            BlockchainType.BITCOIN: "BTC",
-            BlockchainType.SOLANA: "SOL",
-            BlockchainType.TON: "TON",
-        }
-        return symbols_map.get(blockchain, "UNKNOWN")
+        return _CHAIN_SYMBOLS.get(blockchain, "UNKNOWN")
     @staticmethod
     def get_blockchain_info(blockchain: BlockchainType) -> Dict[str, any]:
-        symbol = BlockchainHelper.get_blockchain_symbol(blockchain)
-        decimals = BlockchainHelper.get_blockchain_decimals(blockchain)
         return {
             "name": blockchain.value,
-            "symbol": symbol,
-            "decimals": decimals,
-            "type": "layer1" if blockchain in (
-                BlockchainType.ETHEREUM, BlockchainType.BITCOIN,
-                BlockchainType.SOLANA, BlockchainType.TON, BlockchainType.AVALANCHE
-            ) else "layer2",
+            "symbol": BlockchainHelper.get_blockchain_symbol(blockchain),
+            "decimals": BlockchainHelper.get_blockchain_decimals(blockchain),
+            "type": "layer1" if blockchain in _LAYER1_CHAINS else "layer2",
         }
     @staticmethod
     def format_balance(blockchain: BlockchainType, balance_raw: int) -> str:
-        decimals = BlockchainHelper.get_blockchain_decimals(blockchain)
-        symbol = BlockchainHelper.get_blockchain_symbol(blockchain)
-        balance = balance_raw / (10 ** decimals)
-        return f"{balance:.6f} {symbol}"
+        divisor, template = _BALANCE_FORMATS.get(blockchain, _DEFAULT_BALANCE_FORMAT)
+        return template.format(balance_raw / divisor)
 class USDTHelper:
     USDT_DECIMALS = 6
+    UNITS_PER_USDT = 10 ** USDT_DECIMALS
     @staticmethod
     def get_usdt_contract(blockchain: BlockchainType, settings) -> Optional[str]:
         usdt_contracts = {
@@ -297,10 +301,10 @@ class USDTHelper:
         return usdt_contracts.get(blockchain)
     @staticmethod
     def format_usdt(amount_raw: int) -> float:
-        return amount_raw / (10 ** USDTHelper.USDT_DECIMALS)
+        return amount_raw / USDTHelper.UNITS_PER_USDT
     @staticmethod
     def parse_usdt(amount: float) -> int:
-        return int(amount * (10 ** USDTHelper.USDT_DECIMALS))
+        return int(amount * USDTHelper.UNITS_PER_USDT)
     @staticmethod
     def is_usdt_supported(blockchain: BlockchainType) -> bool:
         return blockchain in (
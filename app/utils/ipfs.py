@@ -6,6 +6,8 @@ from app.config import get_settings
 import re
 MAX_METADATA_SIZE = 1024 * 1024
 MAX_FIELD_LENGTH = 1000
+_SCRIPT_TAG_RE = re.compile(r"(?i)<script.*?>.*?</script>")
+_CID_CHARS_RE = re.compile(r"[A-Za-z0-9_-]+")
 logger = logging.getLogger(__name__)
 settings = get_settings()
 class IPFSClient:
@@ -66,6 +68,11 @@ class IPFSClient:
         return None
     def get_gateway_url(self, ipfs_hash: str) -> str:
         return f"{self.gateway_url}/{ipfs_hash}"
+def _strip_script_tags(value: str) -> str:
+    # Most metadata values contain no markup; skip the regex for them.
+    if "<" not in value:
+        return value
+    return _SCRIPT_TAG_RE.sub("", value)
 def sanitize_metadata(metadata: dict) -> dict:
     if not isinstance(metadata, dict):
         return {}
@@ -76,11 +83,7 @@ def sanitize_metadata(metadata: dict) -> dict:
         if k.startswith("$") or "<script" in k.lower():
             continue
         if isinstance(v, str):
-            val = v.strip()
-            val = re.sub(r"(?i)<script.*?>.*?</script>", "", val)
-            if len(val) > MAX_FIELD_LENGTH:
-                val = val[:MAX_FIELD_LENGTH]
-            clean[k] = val
+            clean[k] = _strip_script_tags(v.strip())[:MAX_FIELD_LENGTH]
         elif isinstance(v, (int, float, bool)):
             clean[k] = v
         elif isinstance(v, dict):
@@ -89,10 +92,7 @@ def sanitize_metadata(metadata: dict) -> dict:
             new_list = []
             for item in v:
                 if isinstance(item, str):
-                    item_val = re.sub(r"(?i)<script.*?>.*?</script>", "", item).strip()
-                    if len(item_val) > MAX_FIELD_LENGTH:
-                        item_val = item_val[:MAX_FIELD_LENGTH]
-                    new_list.append(item_val)
+                    new_list.append(_strip_script_tags(item).strip()[:MAX_FIELD_LENGTH])
                 elif isinstance(item, dict):
                     new_list.append(sanitize_metadata(item))
                 else:
@@ -103,8 +103,8 @@ def validate_cid(cid: str) -> bool:
     if not isinstance(cid, str):
         return False
     cid = cid.strip()
-    if cid.startswith("Qm") and 20 <= len(cid) <= 60 and re.match(r"^[A-Za-z0-9]+$", cid):
-        return True
-    if re.match(r"^[A-Za-z0-9_-]{20,100}$", cid):
-        return True
-    return False
+    # CIDv0 ("Qm" + base58) is a subset of the general charset, so one
+    # length gate plus one full match covers both forms.
+    if not 20 <= len(cid) <= 100:
+        return False
+    return _CID_CHARS_RE.fullmatch(cid) is not None
@@ -7,9 +7,16 @@ from typing import Optional, Dict
 from urllib.parse import parse_qsl
 import json
 from datetime import datetime
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=8)
+def get_bot_token_hmac(bot_token: str) -> "hmac.HMAC":
+    """HMAC-SHA256 keyed with SHA256(bot_token); .copy() it before update()."""
+    secret_key = hashlib.sha256(bot_token.encode('utf-8')).digest()
+    return hmac.new(secret_key, digestmod=hashlib.sha256)
+
 def verify_telegram_init_data(init_data: str, bot_token: str, max_age_seconds: int = 300) -> Optional[Dict]:
 
     if not init_data or not bot_token:
@@ -39,8 +46,9 @@ def verify_telegram_init_data(init_data: str, bot_token: str, max_age_seconds: i
         logger.debug(f"[Telegram] DATA CHECK STRING: {data_check_string}")
 
         # Compute HMAC as per Telegram docs
-        secret_key = hashlib.sha256(bot_token.encode('utf-8')).digest()
-        computed_hash = hmac.new(secret_key, data_check_string.encode('utf-8'), hashlib.sha256).hexdigest()
+        mac = get_bot_token_hmac(bot_token).copy()
+        mac.update(data_check_string.encode('utf-8'))
+        computed_hash = mac.hexdigest()
 
         logger.debug(f"[Telegram] COMPUTED HASH: {computed_hash}")
         logger.debug(f"[Telegram] RECEIVED HASH: {received_hash}")
@@ -1,7 +1,7 @@
 import hmac
-import hashlib
 from typing import Dict, Optional
 from app.config import get_settings
+from app.utils.telegram_init_data import get_bot_token_hmac
 from app.utils.logger import get_logger
 logger = get_logger(__name__)
 def verify_telegram_data(
@@ -23,12 +23,9 @@ def verify_telegram_data(
         if key != "hash":
             check_string_parts.append(f"{key}={data[key]}")
     check_string = "\n".join(check_string_parts)
-    secret_key = hashlib.sha256(bot_token.encode()).digest()
-    computed_hash = hmac.new(
-        secret_key,
-        check_string.encode(),
-        hashlib.sha256
-    ).hexdigest()
+    mac = get_bot_token_hmac(bot_token).copy()
+    mac.update(check_string.encode())
+    computed_hash = mac.hexdigest()
     is_valid = hmac.compare_digest(computed_hash, data_hash)
     if not is_valid:
         logger.warning(f"Invalid Telegram data signature")
@@ -0,0 +1,14 @@
+"""
+Shared entry point for the standalone check scripts
+"""
+import asyncio
+
+
+def run(main):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    return asyncio.run(main)
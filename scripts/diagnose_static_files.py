@@ -7,6 +7,15 @@ import os
 import sys
 from pathlib import Path
 
+def scan_dir(directory, suffix=""):
+    """Map file name -> DirEntry for one directory listing, skipping dotfiles like glob"""
+    with os.scandir(directory) as entries:
+        return {
+            entry.name: entry
+            for entry in entries
+            if not entry.name.startswith(".") and entry.name.endswith(suffix) and entry.is_file()
+        }
+
 def check_static_structure():
     """Verify static file structure"""
     print("=" * 70)
@@ -36,21 +45,22 @@ def check_static_structure():
     
     # Check HTML files
     print("\n📄 HTML Files:")
-    html_files = sorted(webapp_dir.glob("*.html"))
+    html_files = scan_dir(webapp_dir, ".html")
     if html_files:
-        for f in html_files:
-            print(f"   ✓ {f.name} ({f.stat().st_size} bytes)")
+        for name in sorted(html_files):
+            print(f"   ✓ {name} ({html_files[name].stat().st_size} bytes)")
     else:
         print("   ❌ No HTML files found!")
     
     # Check CSS files
     print("\n🎨 CSS Files:")
     css_dir = webapp_dir / "css"
+    css_files = {}
     if css_dir.exists():
-        css_files = sorted(css_dir.glob("*.css"))
+        css_files = scan_dir(css_dir, ".css")
         if css_files:
-            for f in css_files:
-                print(f"   ✓ {f.name} ({f.stat().st_size} bytes)")
+            for name in sorted(css_files):
+                print(f"   ✓ {name} ({css_files[name].stat().st_size} bytes)")
         else:
             print("   ⚠ CSS directory exists but is empty")
     else:
@@ -59,11 +69,12 @@ def check_static_structure():
     # Check JS files
     print("\n📜 JS Files:")
     js_dir = webapp_dir / "js"
+    js_files = {}
     if js_dir.exists():
-        js_files = sorted(js_dir.glob("*.js"))
+        js_files = scan_dir(js_dir, ".js")
         if js_files:
-            for f in js_files[:10]:  # Show first 10
-                print(f"   ✓ {f.name} ({f.stat().st_size} bytes)")
+            for name in sorted(js_files)[:10]:  # Show first 10
+                print(f"   ✓ {name} ({js_files[name].stat().st_size} bytes)")
             if len(js_files) > 10:
                 print(f"   ... and {len(js_files) - 10} more JS files")
         else:
@@ -77,10 +88,10 @@ def check_static_structure():
     if vendor_dir.exists():
         tonconnect_dir = vendor_dir / "tonconnect"
         if tonconnect_dir.exists():
-            files = sorted(tonconnect_dir.glob("*"))
+            files = sorted(name for name in os.listdir(tonconnect_dir) if not name.startswith("."))
             if files:
-                for f in files[:5]:
-                    print(f"   ✓ vendor/tonconnect/{f.name}")
+                for name in files[:5]:
+                    print(f"   ✓ vendor/tonconnect/{name}")
                 if len(files) > 5:
                     print(f"   ... and {len(files) - 5} more vendor files")
             else:
@@ -93,18 +104,19 @@ def check_static_structure():
     # Check permissions
     print("\n🔒 Permissions Check:")
     critical_files = [
-        webapp_dir / "dashboard.html",
-        css_dir / "styles.css" if css_dir.exists() else None,
-        js_dir / "app.js" if js_dir.exists() else None,
+        ("dashboard.html", html_files),
+        ("styles.css", css_files) if css_dir.exists() else None,
+        ("app.js", js_files) if js_dir.exists() else None,
     ]
     
-    for f in [x for x in critical_files if x]:
-        if f.exists():
-            mode = oct(f.stat().st_mode)
-            readable = os.access(f, os.R_OK)
-            print(f"   {f.name}: {mode} {'✓ readable' if readable else '❌ NOT readable'}")
+    for name, listing in [x for x in critical_files if x]:
+        entry = listing.get(name)
+        if entry is not None:
+            mode = oct(entry.stat().st_mode)
+            readable = os.access(entry.path, os.R_OK)
+            print(f"   {name}: {mode} {'✓ readable' if readable else '❌ NOT readable'}")
         else:
-            print(f"   {f.name}: ⚠ Not found")
+            print(f"   {name}: ⚠ Not found")
     
     print("\n" + "=" * 70)
     return True
@@ -13,8 +13,9 @@ try:
     from app.main import app
     print("✅ App imported successfully\n")
     
-    print("📍 Checking registered routes:")
-    print("=" * 70)
+    out = []
+    out.append("📍 Checking registered routes:")
+    out.append("=" * 70)
     
     target_routes = {
         '/api/auth/profile': ['GET'],
@@ -25,33 +26,30 @@ try:
         '/api/v1/user/profile': ['GET'],
     }
     
-    found_routes = {}
-    for route in app.routes:
-        path = route.path if hasattr(route, 'path') else str(route)
-        methods = route.methods if hasattr(route, 'methods') else set()
-        
-        # Check if this is one of our target routes
-        for target, target_methods in target_routes.items():
-            if path == target:
-                found_routes[path] = methods
+    # One pass over app.routes; membership in target_routes is a dict lookup
+    found_routes = {
+        route.path: getattr(route, 'methods', None) or set()
+        for route in app.routes
+        if getattr(route, 'path', None) in target_routes
+    }
     
     # Print results
-    print("\n📋 Auth/Profile Endpoints:")
-    print("-" * 70)
+    out.append("\n📋 Auth/Profile Endpoints:")
+    out.append("-" * 70)
     for target, target_methods in target_routes.items():
         if target in found_routes:
             methods = found_routes[target]
             methods_str = ', '.join(sorted(methods)) if methods else 'N/A'
-            print(f"✅ {target:<35} Methods: {methods_str}")
+            out.append(f"✅ {target:<35} Methods: {methods_str}")
         else:
-            print(f"❌ {target:<35} NOT FOUND")
+            out.append(f"❌ {target:<35} NOT FOUND")
     
-    print("\n" + "=" * 70)
-    print(f"\n✅ Total routes registered: {len(app.routes)}")
+    out.append("\n" + "=" * 70)
+    out.append(f"\n✅ Total routes registered: {len(app.routes)}")
     
     # Show some other routes for verification
-    print("\n📝 Sample of other routes:")
-    print("-" * 70)
+    out.append("\n📝 Sample of other routes:")
+    out.append("-" * 70)
     count = 0
     for route in app.routes:
         if count >= 5:
@@ -60,11 +58,14 @@ try:
         if not path.startswith('/api/static') and not path.startswith('/openapi'):
             methods = route.methods if hasattr(route, 'methods') else set()
             methods_str = ', '.join(sorted(methods)) if methods else 'N/A'
-            print(f"  {path:<40} Methods: {methods_str}")
+            out.append(f"  {path:<40} Methods: {methods_str}")
             count += 1
     
-    print("\n" + "=" * 70)
-    print("\n✅ Route verification complete!")
+    out.append("\n" + "=" * 70)
+    out.append("\n✅ Route verification complete!")
+    
+    # One write instead of a print (and flush) per line
+    sys.stdout.write("\n".join(out) + "\n")
     
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -3,12 +3,21 @@ Marketplace Image Display Fix Verification Test
 Tests that marketplace properly fetches and displays NFT images
 Run: python test_marketplace_images.py
 """
-import asyncio
+import re
 import sys
 from pathlib import Path
 
+ROOT_DIR = Path(__file__).resolve().parent
+MARKETPLACE_HTML = ROOT_DIR / "app" / "static" / "webapp" / "marketplace.html"
+
 # Add app to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(ROOT_DIR))
+
+# One pass over marketplace.html finds every token the frontend check needs;
+# "guard" captures the optional-image idioms that follow image_url.
+FRONTEND_IMAGE_RE = re.compile(
+    r"(?P<token>image_url)(?P<guard> \?| && | :)?|(?P<tag><img|src=)"
+)
 
 
 async def test_marketplace_service_loads_nft_data():
@@ -102,21 +111,25 @@ async def test_frontend_handles_images():
     """Test 4: Verify frontend properly displays images"""
     print("\n✓ Test 4: Frontend Marketplace Display")
     try:
-        from pathlib import Path
+        marketplace_html = MARKETPLACE_HTML.read_text()
         
-        marketplace_html = Path("app/static/webapp/marketplace.html").read_text()
+        found = set()
+        for match in FRONTEND_IMAGE_RE.finditer(marketplace_html):
+            found.add(match.group("token") or match.group("tag"))
+            if match.group("guard"):
+                found.add("guard")
         
         # Check that frontend tries to display image_url
-        if 'image_url' not in marketplace_html:
+        if 'image_url' not in found:
             print("  ✗ Frontend doesn't reference image_url")
             return False
             
-        if '<img' not in marketplace_html or 'src=' not in marketplace_html:
+        if '<img' not in found or 'src=' not in found:
             print("  ✗ Frontend doesn't try to render img tags")
             return False
             
         # Check that frontend handles the optional image
-        if 'image_url ?' in marketplace_html or 'image_url && ' in marketplace_html or 'image_url :' in marketplace_html:
+        if 'guard' in found:
             print("  ✓ Frontend handles optional image_url")
         else:
             print("  ⚠ Frontend might not handle missing images gracefully")
@@ -267,5 +280,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    from script_runner import run
+    exit_code = run(main())
     sys.exit(exit_code)
@@ -132,5 +132,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    from script_runner import run
+    success = run(main())
     sys.exit(0 if success else 1)
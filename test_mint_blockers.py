@@ -1,9 +1,10 @@
 """
 Comprehensive Mint Flow Verification Test
 Tests all blockers have been fixed and the mint pipeline works end-to-end.
-Run: python test_mint_blockers.py
+Run: python test_mint_blockers.py [--fast]
+(--fast skips the checks that need a live database)
 """
-import asyncio
+import re
 import sys
 from uuid import UUID
 from pathlib import Path
@@ -12,6 +13,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+# revision and down_revision assignments, matched in one pass per file
+REVISION_RE = re.compile(rb"^(revision|down_revision) = '([^']+)'", re.MULTILINE)
+
+
 async def test_imports():
     """Test 1: Verify all models and schemas import correctly"""
     print("\n✓ Test 1: Module Imports")
@@ -165,7 +170,6 @@ async def test_migration_chain():
     print("\n✓ Test 6: Migration Chain")
     try:
         from pathlib import Path
-        import re
         
         migrations_dir = Path("alembic/versions")
         migration_files = sorted(migrations_dir.glob("*.py"))
@@ -175,13 +179,13 @@ async def test_migration_chain():
             if mig_file.name.startswith("__"):
                 continue
             
-            content = mig_file.read_text()
-            rev_match = re.search(r"revision = '([^']+)'", content)
-            down_rev_match = re.search(r"down_revision = '([^']+)'", content)
+            assignments = {}
+            for match in REVISION_RE.finditer(mig_file.read_bytes()):
+                assignments.setdefault(match.group(1), match.group(2).decode())
             
-            if rev_match:
-                rev_id = rev_match.group(1)
-                down_rev = down_rev_match.group(1) if down_rev_match else None
+            rev_id = assignments.get(b"revision")
+            if rev_id:
+                down_rev = assignments.get(b"down_revision")
                 revisions[rev_id] = {
                     'file': mig_file.name,
                     'down_revision': down_rev
@@ -247,7 +251,7 @@ async def test_integration():
         return False
 
 
-async def main():
+async def main(fast=False):
     """Run all tests"""
     print("=" * 70)
     print("NFT MINTING BLOCKER VERIFICATION TEST SUITE")
@@ -262,6 +266,10 @@ async def main():
         ("Migration Chain", test_migration_chain),
         ("Integration", test_integration),
     ]
+    if fast:
+        # Opening a DB connection dominates the run; static checks don't need it
+        tests = [t for t in tests if t[1] is not test_database_schema]
+        print("--fast: skipping Database Schema")
     
     results = []
     for name, test_func in tests:
@@ -301,5 +309,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(main())
+    from script_runner import run
+    exit_code = run(main(fast="--fast" in sys.argv[1:]))
     sys.exit(exit_code)
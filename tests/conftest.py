@@ -1,11 +1,27 @@
+import asyncio
+import os
 import pytest
-import uuid
-from sqlalchemy import event, inspect, text
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+# app.config builds Settings() at import time; give it a throwaway config.
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("JWT_SECRET_KEY", "test-jwt-secret-key-0123456789abcdef")
+os.environ.setdefault("MNEMONIC_ENCRYPTION_KEY", "test-mnemonic-encryption-key-0123456789abcd=")
+os.environ.setdefault("ADMIN_PASSWORD", "test-admin-password")
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.pool import StaticPool
-from app.database import Base
-@pytest.fixture
-async def test_db():
+from app.database.base import Base
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+@pytest.fixture(scope="session")
+def event_loop():
+    # One loop for the whole run so the session-scoped engine's pool stays warm.
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
+    yield loop
+    loop.close()
+@pytest.fixture(scope="session")
+async def _engine():
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         connect_args={"check_same_thread": False},
@@ -14,20 +30,60 @@ async def test_db():
     )
     @event.listens_for(engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
+        # pysqlite's implicit BEGIN breaks SAVEPOINT; let SQLAlchemy emit it.
+        dbapi_conn.isolation_level = None
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-    async_session = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-    async with async_session() as session:
-        yield session
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    await engine.dispose()
-    await engine.dispose()
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    # Disposing the engine drops the in-memory database, so no drop_all.
+    # Dispose even if create_all fails, or aiosqlite's thread hangs pytest.
+    assert engine.url.database == ":memory:"
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        yield engine
+    finally:
+        await engine.dispose()
+@pytest.fixture
+async def test_db(_engine):
+    # Tables are created once per session; each test runs inside an outer
+    # transaction that is rolled back. Session commits only release a
+    # SAVEPOINT, so rows never outlive the test.
+    async with _engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await trans.rollback()
+@pytest.fixture(scope="module")
+def app():
+    from app.main import app as _app
+    return _app
+@pytest.fixture(scope="module")
+async def client(app):
+    # Booted once per module. Request db_session alongside it for endpoints
+    # that depend on get_db_session.
+    from httpx import AsyncClient
+    async with AsyncClient(app=app, base_url="http://test") as _client:
+        yield _client
+@pytest.fixture
+def db_session(app, test_db):
+    # Route get_db_session (and its get_db alias) to this test's session so
+    # requests share test_db's rolled-back transaction.
+    from app.database import get_db_session
+    async def _get_test_db_session():
+        yield test_db
+    app.dependency_overrides[get_db_session] = _get_test_db_session
+    try:
+        yield test_db
+    finally:
+        app.dependency_overrides.pop(get_db_session, None)
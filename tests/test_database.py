@@ -0,0 +1,10 @@
+from sqlalchemy import func, select
+from app.models import User
+async def test_commit_is_visible_within_test(test_db):
+    test_db.add(User(email="isolation@example.com", username="isolation", hashed_password="x"))
+    await test_db.commit()
+    count = await test_db.scalar(select(func.count(User.id)))
+    assert count == 1
+async def test_commit_does_not_leak_into_next_test(test_db):
+    count = await test_db.scalar(select(func.count(User.id)))
+    assert count == 0
@@ -0,0 +1,4 @@
+async def test_active_listings_uses_test_session(client, db_session):
+    response = await client.get("/api/v1/marketplace/listings")
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
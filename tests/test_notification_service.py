@@ -0,0 +1,41 @@
+import asyncio
+import pytest
+from uuid import uuid4
+from app.services.notification_service import NotificationService
+class FakeWebSocket:
+    def __init__(self, error=None):
+        self.error = error
+        self.sent = []
+    async def send_text(self, data):
+        if self.error:
+            raise self.error
+        self.sent.append(data)
+@pytest.fixture(autouse=True)
+def clear_connections():
+    NotificationService.active_connections.clear()
+    yield
+    NotificationService.active_connections.clear()
+async def test_send_notification_reaches_every_socket():
+    user_id = uuid4()
+    sockets = [FakeWebSocket(), FakeWebSocket()]
+    for websocket in sockets:
+        await NotificationService.connect(user_id, websocket)
+    await NotificationService.notify_transaction_confirmed(user_id, "0xabc", "mint")
+    assert all(len(websocket.sent) == 1 for websocket in sockets)
+    assert sockets[0].sent == sockets[1].sent
+async def test_failed_sockets_are_dropped_with_their_user():
+    user_id = uuid4()
+    await NotificationService.connect(user_id, FakeWebSocket(error=RuntimeError("socket closed")))
+    await NotificationService.notify_transaction_confirmed(user_id, "0xabc", "mint")
+    assert NotificationService.get_active_users() == 0
+    assert user_id not in NotificationService.active_connections
+async def test_send_to_unknown_user_does_not_register_it():
+    await NotificationService.notify_transaction_confirmed(uuid4(), "0xabc", "mint")
+    assert NotificationService.get_active_users() == 0
+async def test_cancelled_send_drops_the_socket():
+    user_id = uuid4()
+    healthy = FakeWebSocket()
+    await NotificationService.connect(user_id, healthy)
+    await NotificationService.connect(user_id, FakeWebSocket(error=asyncio.CancelledError()))
+    await NotificationService.notify_transaction_confirmed(user_id, "0xabc", "mint")
+    assert NotificationService.active_connections[user_id] == {healthy}
@@ -65,59 +65,62 @@ def verify_endpoints():
         "payment.history": "defined",
     }
     
-    print("=" * 70)
-    print("NFT PLATFORM - FRONTEND-BACKEND INTEGRATION VERIFICATION")
-    print("=" * 70)
+    out = []
+    out.append("=" * 70)
+    out.append("NFT PLATFORM - FRONTEND-BACKEND INTEGRATION VERIFICATION")
+    out.append("=" * 70)
     
-    print("\n✅ EXPECTED API ENDPOINTS:")
+    out.append("\n✅ EXPECTED API ENDPOINTS:")
     for name, path in expected_endpoints.items():
-        print(f"  {name:30} → {path}")
+        out.append(f"  {name:30} → {path}")
     
-    print("\n✅ ROUTER REGISTRATIONS (main.py):")
+    out.append("\n✅ ROUTER REGISTRATIONS (main.py):")
     for router, config in router_registrations.items():
-        print(f"  {router:30} → {config}")
+        out.append(f"  {router:30} → {config}")
     
-    print("\n✅ API DEFINITIONS (api.js):")
+    out.append("\n✅ API DEFINITIONS (api.js):")
     for endpoint, status in api_definitions.items():
-        print(f"  {endpoint:30} → {status}")
+        out.append(f"  {endpoint:30} → {status}")
     
-    print("\n✅ INTEGRATION STATUS:")
-    print("  ✓ Route prefixes corrected")
-    print("  ✓ Duplicate routes removed")
-    print("  ✓ Missing endpoint definitions added")
-    print("  ✓ Frontend → Backend path matching completed")
-    print("  ✓ Telegram authentication configured")
-    print("  ✓ Database models synchronized")
+    out.append("\n✅ INTEGRATION STATUS:")
+    out.append("  ✓ Route prefixes corrected")
+    out.append("  ✓ Duplicate routes removed")
+    out.append("  ✓ Missing endpoint definitions added")
+    out.append("  ✓ Frontend → Backend path matching completed")
+    out.append("  ✓ Telegram authentication configured")
+    out.append("  ✓ Database models synchronized")
     
-    print("\n⚠️  NOT IMPLEMENTED (Optional):")
-    print("  - Collection endpoints (/api/v1/collections/*)")
-    print("  - Testimonial endpoints (/api/v1/testimonials/*)")
-    print("  - These can be added if needed for future features")
+    out.append("\n⚠️  NOT IMPLEMENTED (Optional):")
+    out.append("  - Collection endpoints (/api/v1/collections/*)")
+    out.append("  - Testimonial endpoints (/api/v1/testimonials/*)")
+    out.append("  - These can be added if needed for future features")
     
-    print("\n🧪 TESTING CHECKLIST:")
-    print("  [ ] Telegram login: POST /api/v1/auth/telegram/login")
-    print("  [ ] User profile: GET /api/v1/user/profile")
-    print("  [ ] NFT list: GET /api/v1/nfts")
-    print("  [ ] NFT details: GET /api/v1/nfts/{nft_id}")
-    print("  [ ] Marketplace: GET /api/v1/marketplace/listings")
-    print("  [ ] Create listing: POST /api/v1/marketplace/listings")
-    print("  [ ] Payment balance: GET /api/v1/payments/balance")
-    print("  [ ] Wallet list: GET /api/v1/wallets")
+    out.append("\n🧪 TESTING CHECKLIST:")
+    out.append("  [ ] Telegram login: POST /api/v1/auth/telegram/login")
+    out.append("  [ ] User profile: GET /api/v1/user/profile")
+    out.append("  [ ] NFT list: GET /api/v1/nfts")
+    out.append("  [ ] NFT details: GET /api/v1/nfts/{nft_id}")
+    out.append("  [ ] Marketplace: GET /api/v1/marketplace/listings")
+    out.append("  [ ] Create listing: POST /api/v1/marketplace/listings")
+    out.append("  [ ] Payment balance: GET /api/v1/payments/balance")
+    out.append("  [ ] Wallet list: GET /api/v1/wallets")
     
-    print("\n📝 KEY CHANGES:")
-    print("  1. app/main.py:")
-    print("     - user_router prefix: /api → /api/v1")
-    print("     - Removed duplicate notification_router")
-    print("  2. app/static/webapp/js/api.js:")
-    print("     - Added nft.details() function")
-    print("     - Added nft.collection endpoint")
-    print("     - Added payment.balance endpoint")
-    print("     - Added marketplace user listings endpoints")
-    print("     - Corrected NFT path: /nft/* → /nfts/*")
+    out.append("\n📝 KEY CHANGES:")
+    out.append("  1. app/main.py:")
+    out.append("     - user_router prefix: /api → /api/v1")
+    out.append("     - Removed duplicate notification_router")
+    out.append("  2. app/static/webapp/js/api.js:")
+    out.append("     - Added nft.details() function")
+    out.append("     - Added nft.collection endpoint")
+    out.append("     - Added payment.balance endpoint")
+    out.append("     - Added marketplace user listings endpoints")
+    out.append("     - Corrected NFT path: /nft/* → /nfts/*")
     
-    print("\n✨ INTEGRATION COMPLETE")
-    print("=" * 70)
+    out.append("\n✨ INTEGRATION COMPLETE")
+    out.append("=" * 70)
     
+    # One write instead of a print (and flush) per line
+    sys.stdout.write("\n".join(out) + "\n")
     return 0
 
 if __name__ == "__main__":